@@ -2,6 +2,7 @@ import xarray as xr
 
 from ..echodata import EchoData
 from ..echodata.simrad import check_input_args_combination
+from ..utils.coding import set_processed_zarr_compressor
 from ..utils.log import _init_logger
 from ..utils.prov import echopype_prov_attrs, source_files_vars
 from .calibrate_azfp import CalibrateAZFP
@@ -114,7 +115,7 @@ def _compute_cal(
     if "water_level" in echodata["Platform"].data_vars.keys():
         cal_ds["water_level"] = echodata["Platform"].water_level
 
-    return cal_ds
+    return set_processed_zarr_compressor(cal_ds, (cal_type, "echo_range"))
 
 
 def compute_Sv(echodata: EchoData, **kwargs) -> xr.Dataset:
@@ -1,8 +1,13 @@
+from functools import lru_cache
 from typing import Dict, List, Literal, Union
 
 import numpy as np
 import xarray as xr
 
+# Maximum number of distinct Vendor_specific tables and pulse lengths memoized
+# for matching pulse length dependent cal params
+_CACHE_SIZE = 256
+
 CAL_PARAMS = {
     "EK60": (
         "sa_correction",
@@ -258,6 +263,38 @@ def _get_interp_da(
         return xr.DataArray(param, dims=["channel"], coords={"channel": freq_center["channel"]})
 
 
+def _match_pulse_length(
+    tdn: np.ndarray, pulse_length: np.ndarray, param_table: np.ndarray
+) -> np.ndarray:
+    """
+    Select the ``param_table`` values at the allowable pulse length closest to each
+    transmit_duration_nominal, from channel-first arrays.
+    """
+    # Find idx to select the corresponding param value
+    # by matching tdn with the closest allowable pulse_length in a single vectorized pass.
+    # NaN differences are set to inf so that they are never the closest match,
+    # and NaN tdn entries match to index 0 (to be set back to NaN by the caller)
+    pulse_length_diff = np.abs(tdn[..., np.newaxis] - pulse_length[:, np.newaxis, :])
+    pulse_length_diff[np.isnan(pulse_length_diff)] = np.inf
+    idxmin = pulse_length_diff.argmin(axis=-1)
+    return np.take_along_axis(param_table, idxmin, axis=-1)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _match_pulse_length_cached(
+    tdn_bytes, pulse_length_bytes, pulse_length_shape, param_table_bytes, param_table_dtype
+):
+    pulse_length = np.frombuffer(pulse_length_bytes, dtype=np.float64).reshape(pulse_length_shape)
+    param_table = np.frombuffer(param_table_bytes, dtype=param_table_dtype).reshape(
+        pulse_length_shape
+    )
+    tdn = np.frombuffer(tdn_bytes, dtype=np.float64)
+    # the cached array is shared by all hits, so it is made read-only
+    matched = _match_pulse_length(tdn[:, np.newaxis], pulse_length, param_table)[:, 0]
+    matched.flags.writeable = False
+    return matched
+
+
 def get_vend_cal_params_power(beam: xr.Dataset, vend: xr.Dataset, param: str) -> xr.DataArray:
     """
     Get cal parameters stored in the Vendor_specific group
@@ -285,37 +322,44 @@ def get_vend_cal_params_power(beam: xr.Dataset, vend: xr.Dataset, param: str) ->
     if param not in vend:
         raise ValueError(f"{param} does not exist in the Vendor_specific group!")
 
-    # Find idx to select the corresponding param value
-    # by matching beam["transmit_duration_nominal"] with vend["pulse_length"]
-    transmit_isnull = beam["transmit_duration_nominal"].isnull()
-    idxmin = np.abs(beam["transmit_duration_nominal"] - vend["pulse_length"]).idxmin(
-        dim="pulse_length_bin"
+    # Align channel sequence in vend to that in beam,
+    # and pull all arrays to channel-first numpy arrays
+    transmit_duration = beam["transmit_duration_nominal"]
+    vend = vend.sel(channel=transmit_duration["channel"])
+    # np.asarray only copies when a cast is needed, unlike .astype
+    tdn = np.asarray(transmit_duration.transpose("channel", "ping_time").values, dtype=np.float64)
+    pulse_length = np.asarray(
+        vend["pulse_length"].transpose("channel", "pulse_length_bin").values, dtype=np.float64
     )
-
-    # fill nan position with 0 (will remove before return)
-    # and convert to int for indexing
-    idxmin = idxmin.where(~transmit_isnull, 0).astype(int)
-
-    # Get param dataarray into correct shape
-    da_param = vend[param].transpose("pulse_length_bin", "channel")
-
-    if not np.array_equal(da_param.channel.data, idxmin.channel.data):
-        da_param = da_param.sortby(
-            da_param.channel, ascending=False
-        )  # sortby because channel sequence differs in vend and beam
-
-    da_param = da_param.sel(pulse_length_bin=idxmin, drop=True)
-
-    # Set the nan elements back to nan.
-    # Doing the `.where` will result in float64,
-    # which is fine since we're dealing with nan
-    da_param = da_param.where(~transmit_isnull, np.nan)
-
-    # Clean up for leftover plb variable
-    # if exists
-    plb_var = "pulse_length_bin"
-    if plb_var in da_param.coords:
-        da_param = da_param.drop(plb_var)
+    param_table = vend[param].transpose("channel", "pulse_length_bin").values
+
+    # Pulse length is usually constant over a file:
+    # in that case only the first ping of each channel needs to be matched,
+    # which a single O(N) np.ptp pass detects (NaN tdn makes ptp NaN and fails the check).
+    # The match is then memoized, since the Vendor_specific tables and pulse lengths
+    # repeat across files of the same instrument and survey
+    if tdn.size > 0 and np.all(np.ptp(tdn, axis=1) == 0):
+        matched = _match_pulse_length_cached(
+            tdn[:, 0].tobytes(),
+            pulse_length.tobytes(),
+            pulse_length.shape,
+            param_table.tobytes(),
+            param_table.dtype.str,
+        )[:, np.newaxis]
+    else:
+        matched = _match_pulse_length(tdn, pulse_length, param_table)
+
+    # Set the nan elements back to nan
+    # which results in float64 since we're dealing with nan,
+    # and broadcasts matches from the first ping to all pings
+    param_val = np.where(np.isnan(tdn), np.nan, matched)
+
+    da_param = xr.DataArray(
+        param_val,
+        dims=("channel", "ping_time"),
+        coords=transmit_duration.coords,
+        name=param,
+    ).transpose(*transmit_duration.dims)
 
     return da_param
 
@@ -59,6 +59,9 @@ class CalibrateAZFP(CalibrateBase):
         # range computation different for Sv and TS per AZFP matlab code
         self.compute_echo_range(cal_type=cal_type)
 
+        # Select source of backscatter data
+        beam = self.echodata["Sonar/Beam_group1"]
+
         # Compute derived params
         # TODO: take care of dividing by zero encountered in log10
         spreading_loss = 20 * np.log10(self.range_meter)
@@ -67,11 +70,7 @@ class CalibrateAZFP(CalibrateBase):
 
         # scaling factor (slope) in Fig.G-1, units Volts/dB], see p.84
         a = self.cal_params["DS"]
-        EL = (
-            self.cal_params["EL"]
-            - 2.5 / a
-            + self.echodata["Sonar/Beam_group1"]["backscatter_r"] / (26214 * a)
-        )  # eq.(5)
+        EL = self.cal_params["EL"] - 2.5 / a + beam["backscatter_r"] / (26214 * a)  # eq.(5)
 
         if cal_type == "Sv":
             # eq.(9)
@@ -84,7 +83,7 @@ class CalibrateAZFP(CalibrateBase):
                 * np.log10(
                     0.5
                     * self.env_params["sound_speed"]
-                    * self.echodata["Sonar/Beam_group1"]["transmit_duration_nominal"]
+                    * beam["transmit_duration_nominal"]
                     * self.cal_params["equivalent_beam_angle"]
                 )
                 + self.cal_params["Sv_offset"]
@@ -103,7 +102,7 @@ class CalibrateAZFP(CalibrateBase):
         out = out.merge(self.range_meter)
 
         # Add frequency_nominal to data set
-        out["frequency_nominal"] = self.echodata["Sonar/Beam_group1"]["frequency_nominal"]
+        out["frequency_nominal"] = beam["frequency_nominal"]
 
         # Add env and cal parameters
         out = self._add_params_to_output(out)
@@ -1,5 +1,6 @@
 from typing import Dict
 
+import numexpr as ne
 import numpy as np
 import xarray as xr
 
@@ -22,6 +23,88 @@ from .range import compute_range_EK, range_mod_TVG_EK
 logger = _init_logger(__name__)
 
 
+# Calibration equations fused into single numexpr expressions, with
+# x: backscatter_r in dB for power samples or received power in linear domain
+# for complex samples, r: TVG-modified range, a: absorption,
+# C: all range-independent terms precomputed per channel and ping.
+# Samples at non-positive TVG-modified range or received power are set to NaN.
+_CAL_EXPR = {
+    "power": {
+        "Sv": "where(r > 0, x + 20 * log10(r) + 2 * a * r - C, nan)",
+        "TS": "where(r > 0, x + 40 * log10(r) + 2 * a * r - C, nan)",
+    },
+    "complex": {
+        "Sv": "where((r > 0) & (x > 0), 10 * log10(x) + 20 * log10(r) + 2 * a * r - C, nan)",
+        "TS": "where((r > 0) & (x > 0), 10 * log10(x) + 40 * log10(r) + 2 * a * r - C, nan)",
+    },
+}
+
+# Sv and TS are always computed in float64:
+# float32 power samples are promoted inside the kernel without an extra copy,
+# since float32 errors near 0 dB exceed the tolerance of reference comparisons
+_CAL_DTYPE = np.float64
+
+
+def _cal_kernel(x, r, a, C, encode_mode, cal_type):
+    local_dict = {"x": x, "nan": np.nan}
+    local_dict.update(
+        {k: np.asarray(v, dtype=_CAL_DTYPE) for k, v in {"r": r, "a": a, "C": C}.items()}
+    )
+    return ne.evaluate(_CAL_EXPR[encode_mode][cal_type], local_dict=local_dict)
+
+
+def _cal_fused(
+    encode_mode: str,
+    cal_type: str,
+    samples: xr.DataArray,
+    tvg_mod_range: xr.DataArray,
+    absorption: xr.DataArray,
+    C: xr.DataArray,
+) -> xr.DataArray:
+    """
+    Evaluate the Sv or TS calibration equation in one pass
+    over the (``channel``, ``ping_time``, ``range_sample``) data,
+    instead of allocating a temporary array for each term.
+
+    Parameters
+    ----------
+    encode_mode : str
+        'power' for power samples, or
+        'complex' for received power computed from complex samples
+    cal_type : str
+        'Sv' for calculating volume backscattering strength, or
+        'TS' for calculating target strength
+    samples : xr.DataArray
+        Power samples in dB, or received power in linear domain
+    tvg_mod_range : xr.DataArray
+        TVG-modified range in meters
+    absorption : xr.DataArray
+        Seawater absorption in dB/m
+    C : xr.DataArray
+        Range-independent terms precomputed without the ``range_sample`` dimension,
+        e.g. ``CSv + 2 * sa_correction`` for Sv or ``CSp`` for TS from power samples
+
+    Returns
+    -------
+    xr.DataArray
+        The calibrated Sv or TS in float64
+    """
+    out = xr.apply_ufunc(
+        _cal_kernel,
+        samples,
+        tvg_mod_range,
+        absorption,
+        C,
+        kwargs={"encode_mode": encode_mode, "cal_type": cal_type},
+        # align by label like xarray arithmetic, e.g. user-supplied params in another channel order
+        join="inner",
+        dask="parallelized",
+        output_dtypes=[_CAL_DTYPE],
+    )
+    out.name = cal_type
+    return out
+
+
 class CalibrateEK(CalibrateBase):
     def __init__(self, echodata: EchoData, env_params, cal_params, ecs_file, **kwargs):
         super().__init__(echodata, env_params, cal_params, ecs_file)
@@ -64,57 +147,56 @@ class CalibrateEK(CalibrateBase):
         # Select source of backscatter data
         beam = self.echodata[self.ed_beam_group]
 
+        # Params pulled out once, for clarity and to avoid repeated lookups below
+        sound_speed = self.env_params["sound_speed"]
+        absorption = self.env_params["sound_absorption"]
+        gain = self.cal_params["gain_correction"]
+        transmit_power = beam["transmit_power"]
+
         # Derived params
-        wavelength = self.env_params["sound_speed"] / beam["frequency_nominal"]  # wavelength
-        # range_meter = self.range_meter
+        wavelength = sound_speed / beam["frequency_nominal"]  # wavelength
 
         # TVG compensation with modified range
-        sound_speed = self.env_params["sound_speed"]
-        absorption = self.env_params["sound_absorption"]
         tvg_mod_range = range_mod_TVG_EK(
             self.echodata, self.ed_beam_group, self.range_meter, sound_speed
         )
-        tvg_mod_range = tvg_mod_range.where(tvg_mod_range > 0, np.nan)
-
-        spreading_loss = 20 * np.log10(tvg_mod_range)
-        absorption_loss = 2 * absorption * tvg_mod_range
 
+        # The range-independent terms have no range_sample dimension
+        # and are combined under a single log10 before the fused calibration kernel
         if cal_type == "Sv":
             # Calc gain
+            # sa_correction is folded into the per-channel and per-ping gain terms
+            # so that it is not broadcast over range_sample
             CSv = (
-                10 * np.log10(beam["transmit_power"])
-                + 2 * self.cal_params["gain_correction"]
-                + self.cal_params["equivalent_beam_angle"]
-                + 10
+                10
                 * np.log10(
-                    wavelength**2
+                    transmit_power
+                    * wavelength**2
                     * beam["transmit_duration_nominal"]
-                    * self.env_params["sound_speed"]
+                    * sound_speed
                     / (32 * np.pi**2)
                 )
+                + 2 * gain
+                + self.cal_params["equivalent_beam_angle"]
+                + 2 * self.cal_params["sa_correction"]
             )
 
             # Calibration and echo integration
-            out = (
-                beam["backscatter_r"]  # has beam dim
-                + spreading_loss
-                + absorption_loss
-                - CSv
-                - 2 * self.cal_params["sa_correction"]
+            out = _cal_fused(
+                "power",
+                "Sv",
+                beam["backscatter_r"],  # has beam dim
+                tvg_mod_range,
+                absorption,
+                CSv,
             )
-            out.name = "Sv"
 
         elif cal_type == "TS":
             # Calc gain
-            CSp = (
-                10 * np.log10(beam["transmit_power"])
-                + 2 * self.cal_params["gain_correction"]
-                + 10 * np.log10(wavelength**2 / (16 * np.pi**2))
-            )
+            CSp = 10 * np.log10(transmit_power * wavelength**2 / (16 * np.pi**2)) + 2 * gain
 
             # Calibration and echo integration
-            out = beam["backscatter_r"] + spreading_loss * 2 + absorption_loss - CSp
-            out.name = "TS"
+            out = _cal_fused("power", "TS", beam["backscatter_r"], tvg_mod_range, absorption, CSp)
 
         # Attach calculated range (with units meter) into data set
         out = out.to_dataset()
@@ -151,8 +233,8 @@ class CalibrateEK60(CalibrateEK):
 
         # Set the channels to calibrate
         # For EK60 this is all channels
-        self.chan_sel = self.echodata[self.ed_beam_group]["channel"]
         beam = self.echodata[self.ed_beam_group]
+        self.chan_sel = beam["channel"]
 
         # Convert env_params and cal_params if self.ecs_file exists
         # Note a warning if thrown out in CalibrateBase.__init__
@@ -170,7 +252,7 @@ class CalibrateEK60(CalibrateEK):
         # go through the same sanitization and organization process
         self.env_params = get_env_params_EK(
             sonar_type=self.sonar_type,
-            beam=self.echodata[self.ed_beam_group],
+            beam=beam,
             env=self.echodata["Environment"],
             user_dict=self.env_params,
         )
@@ -237,17 +319,19 @@ class CalibrateEK80(CalibrateEK):
         )
 
         # Select the channels to calibrate
+        # Look up the group once: each EchoData access rebuilds and re-sanitizes the dataset
+        beam = self.echodata[self.ed_beam_group]
         if self.encode_mode == "power":
             # Power sample only possible under CW mode,
             # and all power samples will live in the same group
-            self.chan_sel = self.echodata[self.ed_beam_group]["channel"]
+            self.chan_sel = beam["channel"]
         else:
             # Complex samples can be CW or BB, so select based on waveform mode
-            chan_dict = self._get_chan_dict(self.echodata[self.ed_beam_group])
+            chan_dict = self._get_chan_dict(beam)
             self.chan_sel = chan_dict[self.waveform_mode]
 
         # Subset of the right Sonar/Beam_groupX group given the selected channels
-        beam = self.echodata[self.ed_beam_group].sel(channel=self.chan_sel)
+        beam = beam.sel(channel=self.chan_sel)
 
         # Use center frequency if in BB mode, else use nominal channel frequency
         if self.waveform_mode == "BB":
@@ -519,14 +603,9 @@ class CalibrateEK80(CalibrateEK):
         tvg_mod_range = range_mod_TVG_EK(
             self.echodata, self.ed_beam_group, range_meter, sound_speed
         )
-        tvg_mod_range = tvg_mod_range.where(tvg_mod_range > 0, np.nan)
-
-        spreading_loss = 20 * np.log10(tvg_mod_range)
-        absorption_loss = 2 * absorption * tvg_mod_range
 
         # Get power from complex samples
         prx = self._get_power_from_complex(beam=beam, chirp=tx, z_et=z_et, z_er=z_er)
-        prx = prx.where(prx > 0, np.nan)
 
         # Compute based on cal_type
         if cal_type == "Sv":
@@ -549,32 +628,21 @@ class CalibrateEK80(CalibrateEK):
             # TODO: THIS ONE CARRIES THE BEAM DIMENSION AROUND
             psifc = self.cal_params["equivalent_beam_angle"]
 
-            out = (
-                10 * np.log10(prx)
-                + spreading_loss
-                + absorption_loss
-                - 10 * np.log10(wavelength**2 * transmit_power * sound_speed / (32 * np.pi**2))
-                - 2 * gain
-                - 10 * np.log10(tau_effective)
-                - psifc
+            C = (
+                10 * np.log10(wavelength**2 * transmit_power * sound_speed / (32 * np.pi**2))
+                + 2 * gain
+                + 10 * np.log10(tau_effective)
+                + psifc
             )
 
             # Correct for sa_correction if CW mode
             if self.waveform_mode == "CW":
-                out = out - 2 * self.cal_params["sa_correction"]
-
-            out.name = "Sv"
-            # out = out.rename_vars({list(out.data_vars.keys())[0]: "Sv"})
+                C = C + 2 * self.cal_params["sa_correction"]
 
         elif cal_type == "TS":
-            out = (
-                10 * np.log10(prx)
-                + 2 * spreading_loss
-                + absorption_loss
-                - 10 * np.log10(wavelength**2 * transmit_power / (16 * np.pi**2))
-                - 2 * gain
-            )
-            out.name = "TS"
+            C = 10 * np.log10(wavelength**2 * transmit_power / (16 * np.pi**2)) + 2 * gain
+
+        out = _cal_fused("complex", cal_type, prx, tvg_mod_range, absorption, C)
 
         # Attach calculated range (with units meter) into data set
         out = out.to_dataset().merge(range_meter)
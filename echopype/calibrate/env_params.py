@@ -289,18 +289,20 @@ def get_env_params_EK(
 
     # If EK80, get env parameters from data if not provided in user dict
     # All T, S, P, pH are needed because we always have to compute sound absorption for EK80 data
+    # Parameters from data are loaded into memory once here, since they are small
+    # but used many times downstream and would otherwise be re-read from the file each time
     if not tspa_all_exist and sonar_type == "EK80":
         for p_user, p_data in zip(
             ["temperature", "salinity", "pressure", "pH"],  # name in defined env params
             ["temperature", "salinity", "depth", "acidity"],  # name in EK80 data
         ):
-            out_dict[p_user] = user_dict.get(p_user, env[p_data])
+            out_dict[p_user] = user_dict[p_user] if p_user in user_dict else env[p_data].load()
 
     # Sound speed
     if out_dict["sound_speed"] is None:
         if not tspa_all_exist:
             # sounds speed always exist in EK60 and EK80 data
-            out_dict["sound_speed"] = env["sound_speed_indicative"]
+            out_dict["sound_speed"] = env["sound_speed_indicative"].load()
             out_dict.pop("formula_sound_speed")
         else:
             # default to Mackenzie sound speed formula if not in user dict
@@ -320,7 +322,7 @@ def get_env_params_EK(
     if out_dict["sound_absorption"] is None:
         if not tspa_all_exist and sonar_type != "EK80":  # this should not happen for EK80
             # absorption always exist in EK60 data
-            out_dict["sound_absorption"] = env["absorption_indicative"]
+            out_dict["sound_absorption"] = env["absorption_indicative"].load()
             out_dict.pop("formula_absorption")
         else:
             # default to FG absorption if not in user dict
@@ -1,6 +1,7 @@
 import numpy as np
 
 from ..utils import uwa
+from ..utils.compute import _lin2log, _log2lin, _log2lin_expm1
 
 
 class NoiseEst:
@@ -39,16 +40,16 @@ class NoiseEst:
             sound_absorption = self.ds_Sv["sound_absorption"]
 
         # Transmission loss
-        self.spreading_loss = 20 * np.log10(
-            self.ds_Sv["echo_range"].where(self.ds_Sv["echo_range"] >= 1, other=1)
-        )
+        # echo_range is clamped to >= 1 m (NaN is treated as 1 m) in a single fmax pass.
+        # Samples within 1 m are in the transducer near-field and not reliable,
+        # the clamp only removes the log10 singularity at the transducer face
+        # without biasing the spreading loss at larger ranges
+        self.spreading_loss = 20 * np.log10(np.fmax(self.ds_Sv["echo_range"], 1))
         self.absorption_loss = 2 * sound_absorption * self.ds_Sv["echo_range"]
 
     def _compute_power_cal(self):
         """Compute calibrated power without TVG, linear domain"""
-        self.power_cal = 10 ** (
-            (self.ds_Sv["Sv"] - self.spreading_loss - self.absorption_loss) / 10
-        )
+        self.power_cal = _log2lin(self.ds_Sv["Sv"] - self.spreading_loss - self.absorption_loss)
 
     def estimate_noise(self, noise_max=None):
         """Estimate noise from a collected of pings
@@ -58,7 +59,7 @@ class NoiseEst:
         noise_max : Union[int, float]
             the upper limit for background noise expected under the operating conditions
         """
-        power_cal_binned_avg = 10 * np.log10(  # binned averages of calibrated power
+        power_cal_binned_avg = _lin2log(  # binned averages of calibrated power
             self.power_cal.coarsen(
                 ping_time=self.ping_num,
                 range_sample=self.range_sample_num,
@@ -105,9 +106,11 @@ class NoiseEst:
         self.estimate_noise(noise_max=noise_max)
 
         # Sv corrected for noise
-        # linear domain
-        fac = 10 ** (self.ds_Sv["Sv"] / 10) - 10 ** (self.Sv_noise / 10)
-        Sv_corr = 10 * np.log10(fac.where(fac > 0, other=np.nan))
+        # subtracted in linear domain, written in terms of the difference Sv - Sv_noise
+        # so that signals just above the noise level do not suffer from cancellation:
+        # 10*log10(sv - sv_noise) = Sv_noise + 10*log10(10**((Sv - Sv_noise)/10) - 1)
+        fac = _log2lin_expm1(self.ds_Sv["Sv"] - self.Sv_noise)
+        Sv_corr = _lin2log(fac.where(fac > 0, other=np.nan)) + self.Sv_noise
         Sv_corr = Sv_corr.where(
             Sv_corr - self.Sv_noise > SNR_threshold, other=np.nan
         )  # other=-999 (from paper)
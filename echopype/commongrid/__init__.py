@@ -1,7 +1,8 @@
-from .api import compute_MVBS, compute_MVBS_index_binning, compute_NASC
+from .api import compute_MVBS, compute_MVBS_index_binning, compute_MVBS_rolling, compute_NASC
 
 __all__ = [
     "compute_MVBS",
     "compute_NASC",
     "compute_MVBS_index_binning",
+    "compute_MVBS_rolling",
 ]
@@ -10,11 +10,15 @@ import pandas as pd
 import xarray as xr
 
 from ..consolidate.api import POSITION_VARIABLES
+from ..utils.coding import set_processed_zarr_compressor
+from ..utils.compute import _lin2log, _log2lin
 from ..utils.prov import add_processing_level, echopype_prov_attrs, insert_input_processing_level
 from .utils import (
+    _block_reduce_3d,
     _convert_bins_to_interval_index,
     _get_reduced_positions,
     _parse_x_bin,
+    _rolling_mean_3d,
     _set_MVBS_attrs,
     _set_var_attrs,
     _setup_and_validate,
@@ -184,11 +188,11 @@ def compute_MVBS(
 
     ds_MVBS = insert_input_processing_level(ds_MVBS, input_ds=ds_Sv)
 
-    return ds_MVBS
+    return set_processed_zarr_compressor(ds_MVBS, ("Sv", "echo_range"))
 
 
 @add_processing_level("L3*")
-def compute_MVBS_index_binning(ds_Sv, range_sample_num=100, ping_num=100):
+def compute_MVBS_index_binning(ds_Sv, range_sample_num=100, ping_num=100, log_space_avg=False):
     """
     Compute Mean Volume Backscattering Strength (MVBS)
     based on intervals of ``range_sample`` and ping number (``ping_num``) specified in index number.
@@ -205,33 +209,47 @@ def compute_MVBS_index_binning(ds_Sv, range_sample_num=100, ping_num=100):
         number of samples to average along the ``range_sample`` dimension, default to 100
     ping_num : int
         number of pings to average, default to 100
+    log_space_avg : bool
+        whether to average Sv directly in the log domain (dB), default to ``False``.
+        This skips the transforms to and from the linear domain
+        and is only an approximation of MVBS:
+        the dB mean is always lower than or equal to the linear-domain mean,
+        and the bias grows with the variability of Sv within each bin.
+        It is best reserved for quick looks with small bins (e.g. fewer than 10 samples)
 
     Returns
     -------
     A dataset containing bin-averaged Sv
     """
-    da_sv = 10 ** (ds_Sv["Sv"] / 10)  # average should be done in linear domain
-    da = 10 * np.log10(
-        da_sv.coarsen(ping_time=ping_num, range_sample=range_sample_num, boundary="pad").mean(
-            skipna=True
-        )
-    )
+    dims = ("channel", "ping_time", "range_sample")
+    Sv = ds_Sv["Sv"].transpose(*dims).data
+    echo_range = ds_Sv["echo_range"].transpose(*dims).data
+
+    if log_space_avg:
+        Sv_avg = _block_reduce_3d(Sv, ping_num, range_sample_num)
+    else:
+        # average should be done in linear domain
+        Sv_avg = _lin2log(_block_reduce_3d(_log2lin(Sv), ping_num, range_sample_num))
 
-    # Attach attributes and coarsened echo_range
-    da.name = "Sv"
-    ds_MVBS = da.to_dataset()
+    # Attach attributes and binned echo_range (use first value in each average bin)
+    ds_MVBS = xr.Dataset(
+        data_vars={
+            "Sv": (dims, Sv_avg),
+            "echo_range": (
+                dims,
+                _block_reduce_3d(echo_range, ping_num, range_sample_num, func=np.nanmin),
+            ),
+        },
+        coords={
+            "channel": ds_Sv["channel"],
+            "ping_time": ds_Sv["ping_time"][::ping_num],  # interval start
+        },
+    )
     ds_MVBS.coords["range_sample"] = (
         "range_sample",
         np.arange(ds_MVBS["range_sample"].size),
         {"long_name": "Along-range sample number, base 0"},
     )  # reset range_sample to start from 0
-    ds_MVBS["echo_range"] = (
-        ds_Sv["echo_range"]
-        .coarsen(  # binned echo_range (use first value in each average bin)
-            ping_time=ping_num, range_sample=range_sample_num, boundary="pad"
-        )
-        .min(skipna=True)
-    )
     _set_MVBS_attrs(ds_MVBS)
     ds_MVBS["Sv"] = ds_MVBS["Sv"].assign_attrs(
         {
@@ -241,7 +259,8 @@ def compute_MVBS_index_binning(ds_Sv, range_sample_num=100, ping_num=100):
                 f"range_sample: mean (interval: {range_sample_num} samples along range "
                 "comment: range_sample is the interval start)"
             ),
-            "comment": "MVBS binned on the basis of range_sample and ping number specified as index numbers",  # noqa
+            "comment": "MVBS binned on the basis of range_sample and ping number specified as index numbers"  # noqa
+            + (", averaged in the log domain" if log_space_avg else ""),
             "binning_mode": "sample number",
             "range_sample_interval": f"{range_sample_num} samples along range",
             "ping_interval": f"{ping_num} pings",
@@ -259,7 +278,78 @@ def compute_MVBS_index_binning(ds_Sv, range_sample_num=100, ping_num=100):
 
     ds_MVBS = insert_input_processing_level(ds_MVBS, input_ds=ds_Sv)
 
-    return ds_MVBS
+    return set_processed_zarr_compressor(ds_MVBS, ("Sv", "echo_range"))
+
+
+@add_processing_level("L3*")
+def compute_MVBS_rolling(ds_Sv, range_sample_num=100, ping_num=100):
+    """
+    Compute Mean Volume Backscattering Strength (MVBS)
+    averaged over a rolling window of ``range_sample`` and ping number (``ping_num``)
+    specified in index number.
+
+    Unlike ``compute_MVBS_index_binning``, which averages non-overlapping bins,
+    the output has the same shape and coordinates as the input Sv.
+    Each value is the average over the window of ``ping_num`` pings and ``range_sample_num``
+    samples ending at (and including) that ping and sample;
+    windows at the start of each dimension are truncated to the available data.
+
+    Parameters
+    ----------
+    ds_Sv : xr.Dataset
+        dataset containing ``Sv`` and ``echo_range`` [m]
+    range_sample_num : int
+        number of samples in the rolling window along the ``range_sample`` dimension,
+        default to 100
+    ping_num : int
+        number of pings in the rolling window, default to 100
+
+    Returns
+    -------
+    A dataset containing rolling-averaged Sv
+    """
+    dims = ("channel", "ping_time", "range_sample")
+    sv = _log2lin(ds_Sv["Sv"].transpose(*dims).data)  # average should be done in linear domain
+
+    ds_MVBS = xr.Dataset(
+        data_vars={
+            "Sv": (dims, _lin2log(_rolling_mean_3d(sv, ping_num, range_sample_num))),
+            "echo_range": ds_Sv["echo_range"].transpose(*dims),
+        },
+        coords={
+            "channel": ds_Sv["channel"],
+            "ping_time": ds_Sv["ping_time"],
+            "range_sample": ds_Sv["range_sample"],
+        },
+    )
+    _set_MVBS_attrs(ds_MVBS)
+    ds_MVBS["Sv"] = ds_MVBS["Sv"].assign_attrs(
+        {
+            "cell_methods": (
+                f"ping_time: mean (interval: {ping_num} pings "
+                "comment: ping_time is the interval end) "
+                f"range_sample: mean (interval: {range_sample_num} samples along range "
+                "comment: range_sample is the interval end)"
+            ),
+            "comment": "MVBS averaged over a rolling window of range_sample and ping number specified as index numbers",  # noqa
+            "binning_mode": "sample number",
+            "range_sample_interval": f"{range_sample_num} samples along range",
+            "ping_interval": f"{ping_num} pings",
+            "actual_range": [
+                round(float(ds_MVBS["Sv"].min().values), 2),
+                round(float(ds_MVBS["Sv"].max().values), 2),
+            ],
+        }
+    )
+
+    prov_dict = echopype_prov_attrs(process_type="processing")
+    prov_dict["processing_function"] = "commongrid.compute_MVBS_rolling"
+    ds_MVBS = ds_MVBS.assign_attrs(prov_dict)
+    ds_MVBS["frequency_nominal"] = ds_Sv["frequency_nominal"]  # re-attach frequency_nominal
+
+    ds_MVBS = insert_input_processing_level(ds_MVBS, input_ds=ds_Sv)
+
+    return set_processed_zarr_compressor(ds_MVBS, ("Sv", "echo_range"))
 
 
 @add_processing_level("L4")
@@ -1,7 +1,8 @@
 import logging
 import re
-from typing import Literal, Optional, Tuple, Union
+from typing import Callable, Literal, Optional, Tuple, Union
 
+import dask.array
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -199,6 +200,190 @@ def get_distance_from_latlon(ds_Sv):
     return df_pos["dist"].values
 
 
+def _block_reduce_3d(
+    arr: Union[np.ndarray, dask.array.Array],
+    ping_num: int,
+    range_sample_num: int,
+    func: Callable = np.nanmean,
+) -> Union[np.ndarray, dask.array.Array]:
+    """
+    Reduce non-overlapping blocks of ``ping_num`` pings and ``range_sample_num``
+    samples of a 3D (``channel``, ``ping_time``, ``range_sample``) array.
+
+    The trailing edges are NaN-padded so that both binned dimensions are divisible
+    by the block sizes, and the padded array is viewed as a 5D array
+    (``channel``, ping block, ``ping_num``, range block, ``range_sample_num``)
+    so that a single reduction over axes (2, 4) computes all blocks at once.
+    This is equivalent to ``coarsen(..., boundary="pad")`` followed by a NaN-skipping
+    reduction, without the per-block overhead of xarray.
+
+    For dask arrays, chunks along the binned dimensions are first aligned
+    to whole blocks so that each chunk is reduced independently
+    and memory use stays bounded by the chunk size.
+
+    Parameters
+    ----------
+    arr : np.ndarray or dask.array.Array
+        3D float array with dimensions (``channel``, ``ping_time``, ``range_sample``)
+    ping_num : int
+        number of pings in each block
+    range_sample_num : int
+        number of range samples in each block
+    func : Callable, default np.nanmean
+        NaN-skipping reduction function accepting an ``axis`` argument
+
+    Returns
+    -------
+    np.ndarray or dask.array.Array
+        The reduced array with dimensions (``channel``, ping block, range block)
+    """
+    if isinstance(arr, dask.array.Array):
+        block_sizes = (1, ping_num, range_sample_num)
+        arr = arr.rechunk(tuple(max(1, c // b) * b for c, b in zip(arr.chunksize, block_sizes)))
+        return arr.map_blocks(
+            _block_reduce_3d,
+            ping_num,
+            range_sample_num,
+            func,
+            chunks=tuple(
+                tuple(-(-c // b) for c in chunks) for chunks, b in zip(arr.chunks, block_sizes)
+            ),
+            dtype=arr.dtype,
+        )
+
+    channel_len, ping_time_len, range_sample_len = arr.shape
+    ping_pad = -ping_time_len % ping_num
+    range_sample_pad = -range_sample_len % range_sample_num
+    if ping_pad or range_sample_pad:
+        arr = np.pad(arr, ((0, 0), (0, ping_pad), (0, range_sample_pad)), constant_values=np.nan)
+
+    arr = arr.reshape(
+        channel_len,
+        (ping_time_len + ping_pad) // ping_num,
+        ping_num,
+        (range_sample_len + range_sample_pad) // range_sample_num,
+        range_sample_num,
+    )
+
+    # all-NaN blocks are expected and should be NaN without a warning:
+    # they are filled before reducing and set back to NaN after,
+    # since warning filters are process-wide and not thread-safe under dask
+    empty = np.isnan(arr).all(axis=(2, 4))
+    has_empty = empty.any()
+    if has_empty:
+        arr = np.where(empty[:, :, np.newaxis, :, np.newaxis], 0, arr)
+    reduced = func(arr, axis=(2, 4))
+    if has_empty:
+        reduced[empty] = np.nan
+    return reduced
+
+
+def _rolling_sum(arr: np.ndarray, window: int, axis: int) -> np.ndarray:
+    """
+    Sum each element of ``arr`` with the ``window - 1`` elements preceding it along ``axis``.
+
+    Windows at the start of the axis are truncated to the available elements.
+    The sums are computed in O(N) regardless of the window size
+    by splitting the axis into blocks of ``window`` elements
+    and adding the suffix sum within one block to the prefix sum within the next,
+    so that each output is a sum of at most ``window`` elements
+    without the cancellation error of differencing a cumulative sum.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array to be summed
+    window : int
+        Number of elements in each window
+    axis : int
+        Axis along which to sum
+
+    Returns
+    -------
+    np.ndarray
+        Array of the same shape as ``arr`` containing the window sums
+    """
+    if window == 1:
+        return arr
+    arr = np.moveaxis(arr, axis, -1)
+    n = arr.shape[-1]
+
+    # Front pad to truncate the first windows and back pad to whole blocks
+    pad = [(0, 0)] * (arr.ndim - 1) + [(window - 1, -(n + window - 1) % window)]
+    blocks = np.pad(arr, pad).reshape(*arr.shape[:-1], -1, window)
+    prefix = np.cumsum(blocks, axis=-1).reshape(*arr.shape[:-1], -1)
+    suffix = np.flip(np.cumsum(np.flip(blocks, axis=-1), axis=-1), axis=-1)
+    suffix = suffix.reshape(*arr.shape[:-1], -1)
+
+    # Window [i, i + window - 1] of the padded axis is a single block if it starts a block,
+    # otherwise it is the suffix of one block plus the prefix of the next
+    start = np.arange(n)
+    out = np.where(
+        start % window == 0,
+        suffix[..., start],
+        suffix[..., start] + prefix[..., start + window - 1],
+    )
+    return np.moveaxis(out, -1, axis)
+
+
+def _rolling_mean_3d(
+    arr: Union[np.ndarray, dask.array.Array],
+    ping_num: int,
+    range_sample_num: int,
+) -> Union[np.ndarray, dask.array.Array]:
+    """
+    NaN-skipping mean over a rolling window of ``ping_num`` pings and ``range_sample_num``
+    samples of a 3D (``channel``, ``ping_time``, ``range_sample``) array.
+
+    Each output element is the mean over a window ending at (and including) that element,
+    matching ``rolling(..., center=False, min_periods=1)`` in xarray.
+    The window sums of values and of non-NaN counts are computed separably
+    along each dimension using ``_rolling_sum``,
+    so the cost does not grow with the window size.
+
+    For dask arrays, each chunk is extended by the preceding
+    ``ping_num - 1`` pings and ``range_sample_num - 1`` samples from its neighbors.
+
+    Parameters
+    ----------
+    arr : np.ndarray or dask.array.Array
+        3D float array with dimensions (``channel``, ``ping_time``, ``range_sample``)
+    ping_num : int
+        number of pings in each window
+    range_sample_num : int
+        number of range samples in each window
+
+    Returns
+    -------
+    np.ndarray or dask.array.Array
+        The rolling mean with the same shape as ``arr``
+    """
+    if isinstance(arr, dask.array.Array):
+        return arr.map_overlap(
+            _rolling_mean_3d,
+            depth={
+                0: 0,
+                1: min(ping_num, arr.shape[1]) - 1,
+                2: min(range_sample_num, arr.shape[2]) - 1,
+            },
+            boundary="none",
+            dtype=arr.dtype,
+            ping_num=ping_num,
+            range_sample_num=range_sample_num,
+        )
+
+    valid = ~np.isnan(arr)
+    sums = np.where(valid, arr, 0)
+    counts = valid.astype(arr.dtype)
+    for window, axis in [(ping_num, 1), (range_sample_num, 2)]:
+        sums = _rolling_sum(sums, window, axis)
+        counts = _rolling_sum(counts, window, axis)
+
+    # all-NaN windows are expected and should be NaN without a warning
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan).astype(arr.dtype, copy=False)
+
+
 def _set_var_attrs(da, long_name, units, round_digits, standard_name=None):
     """
     Attach common attributes to DataArray variable.
@@ -22,7 +22,11 @@ def open_converted(
         options for cloud storage
     kwargs : dict
         optional keyword arguments to be passed
-        into xr.open_dataset
+        into xr.open_dataset.
+        For files larger than memory, pass ``chunks`` (e.g. ``chunks={}`` to use
+        the on-disk chunks) to open the data as dask arrays, so that
+        subsequent calibration and MVBS computation are evaluated lazily
+        chunk by chunk
 
     Returns
     -------
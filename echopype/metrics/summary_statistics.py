@@ -12,6 +12,8 @@ https://github.com/ElOceanografo/EchoMetrics/blob/master/echometrics/echometrics
 import numpy as np
 import xarray as xr
 
+from ..utils.compute import _lin2log, _log2lin
+
 
 def delta_z(ds: xr.Dataset, range_label="echo_range") -> xr.DataArray:
     """Helper function to calculate widths between range samples (dz) for discretized integral.
@@ -45,7 +47,7 @@ def convert_to_linear(ds: xr.Dataset, Sv_label="Sv") -> xr.DataArray:
     -------
     xr.DataArray
     """
-    return 10 ** (ds[Sv_label] / 10)
+    return _log2lin(ds[Sv_label])
 
 
 def abundance(ds: xr.Dataset, range_label="echo_range") -> xr.DataArray:
@@ -65,7 +67,7 @@ def abundance(ds: xr.Dataset, range_label="echo_range") -> xr.DataArray:
     """
     dz = delta_z(ds, range_label=range_label)
     sv = convert_to_linear(ds, "Sv")
-    return 10 * np.log10((sv * dz).sum(dim="range_sample"))
+    return _lin2log((sv * dz).sum(dim="range_sample"))
 
 
 def center_of_mass(ds: xr.Dataset, range_label="echo_range") -> xr.DataArray:
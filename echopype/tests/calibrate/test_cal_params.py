@@ -12,6 +12,7 @@ from echopype.calibrate.cal_params import (
     get_cal_params_AZFP,
     get_cal_params_EK,
     get_vend_cal_params_power,
+    _match_pulse_length_cached,
 )
 
 DATA = np.random.rand(2, 200)
@@ -853,14 +854,66 @@ def test_get_cal_params_EK60(beam_EK, vend_EK, freq_center, user_dict, out_dict)
                 name="sa_correction",
             ),
         ),
+        # transmit_duration_nominal constant over ping_time
+        (
+            "sa_correction",
+            xr.DataArray(
+                np.array(
+                    [
+                        [256, 256, 256, 256],
+                        [1024, 1024, 1024, 1024],
+                    ]
+                ).T,
+                dims=["ping_time", "channel"],
+                coords={"ping_time": [1, 2, 3, 4], "channel": ["chA", "chB"]},
+                name="transmit_duration_nominal",
+            ).to_dataset(),
+            xr.DataArray(
+                np.array(
+                    [
+                        [30, 30, 30, 30],
+                        [140, 140, 140, 140],
+                    ]
+                ).T,
+                dims=["ping_time", "channel"],
+                coords={"ping_time": [1, 2, 3, 4], "channel": ["chA", "chB"]},
+                name="sa_correction",
+            ).astype(np.float64),
+        ),
     ],
     ids=[
         "in_no_nan_channel_order_same",
         "in_no_nan_channel_order_diff",
         "in_with_nan_channel_order_same",
         "in_with_nan_channel_order_diff",
+        "in_constant_pulse_length",
     ],
 )
 def test_get_vend_cal_params_power(vend_EK, beam, param, da_output):
     da_param = get_vend_cal_params_power(beam, vend_EK, param)
     assert_allclose(da_param, da_output)
+
+
+def test_get_vend_cal_params_power_cached(vend_EK):
+    beam = xr.DataArray(
+        np.array([[256, 256, 256], [1024, 1024, 1024]]),
+        dims=["channel", "ping_time"],
+        coords={"channel": ["chA", "chB"], "ping_time": [1, 2, 3]},
+        name="transmit_duration_nominal",
+    ).to_dataset()
+
+    # constant pulse length is memoized, variable pulse length is matched per ping
+    _match_pulse_length_cached.cache_clear()
+    da_first = get_vend_cal_params_power(beam, vend_EK, "sa_correction")
+    da_second = get_vend_cal_params_power(beam, vend_EK, "sa_correction")
+    assert _match_pulse_length_cached.cache_info().hits == 1
+    assert_allclose(da_first, da_second)
+
+    # returned values are writable and do not alter the cache
+    da_first.values[:] = 0
+    assert_allclose(get_vend_cal_params_power(beam, vend_EK, "sa_correction"), da_second)
+
+    # a different table is not a cache hit
+    vend_EK["sa_correction"] = vend_EK["sa_correction"] + 1
+    assert_allclose(get_vend_cal_params_power(beam, vend_EK, "sa_correction"), da_second + 1)
+    assert _match_pulse_length_cached.cache_info().misses == 2
@@ -3,6 +3,7 @@ import pandas as pd
 import pytest
 from scipy.io import loadmat
 import echopype as ep
+from echopype.calibrate.calibrate_ek import _cal_fused
 from echopype.calibrate.env_params_old import EnvParams
 import xarray as xr
 
@@ -263,3 +264,103 @@ def test_compute_Sv_ek80_CW_complex_BB_complex(ek80_cal_path, ek80_path):
         ed, waveform_mode="BB", encode_mode="complex"
     )
     assert isinstance(ds_Sv, xr.Dataset)
+
+
+@pytest.fixture
+def fused_cal_inputs():
+    """Random calibration inputs on 2 channels, 5 pings and 7 range samples."""
+    rng = np.random.default_rng(0)
+    coords = {"channel": ["chA", "chB"], "ping_time": np.arange(5)}
+    dims = ("channel", "ping_time", "range_sample")
+    return {
+        "dims": dims,
+        # power samples are stored as float32
+        "power": xr.DataArray(
+            rng.uniform(-100, 0, (2, 5, 7)).astype(np.float32), dims=dims, coords=coords
+        ),
+        # complex samples are reduced to received power, including non-positive values
+        "complex": xr.DataArray(rng.uniform(-1e-6, 1e-3, (2, 5, 7)), dims=dims, coords=coords),
+        # non-positive range is masked in the calibration
+        "tvg_mod_range": xr.DataArray(rng.uniform(-1, 50, (2, 5, 7)), dims=dims, coords=coords),
+        "absorption": xr.DataArray(
+            [0.01, 0.03], dims=["channel"], coords={"channel": coords["channel"]}
+        ),
+        "C": xr.DataArray(rng.uniform(0, 10, (2, 5)), dims=dims[:2], coords=coords),
+        "sa_correction": xr.DataArray(rng.uniform(0, 1, (2, 5)), dims=dims[:2], coords=coords),
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunks", [None, {"ping_time": 2}])
+def test_cal_power_fused(fused_cal_inputs, chunks):
+    """
+    Tests the fused power sample calibration against the term-by-term equations.
+    """
+    dims = fused_cal_inputs["dims"]
+    backscatter_r = fused_cal_inputs["power"]
+    tvg_mod_range = fused_cal_inputs["tvg_mod_range"]
+    absorption = fused_cal_inputs["absorption"]
+    C = fused_cal_inputs["C"]
+    sa_correction = fused_cal_inputs["sa_correction"]
+    if chunks is not None:
+        backscatter_r = backscatter_r.chunk(chunks)
+        tvg_mod_range = tvg_mod_range.chunk(chunks)
+
+    # Term-by-term calibration equations
+    r = tvg_mod_range.where(tvg_mod_range > 0, np.nan)
+    Sv = backscatter_r + 20 * np.log10(r) + 2 * absorption * r - C - 2 * sa_correction
+    TS = backscatter_r + 40 * np.log10(r) + 2 * absorption * r - C
+
+    da_Sv = _cal_fused(
+        "power", "Sv", backscatter_r, tvg_mod_range, absorption, C + 2 * sa_correction
+    )
+    da_TS = _cal_fused("power", "TS", backscatter_r, tvg_mod_range, absorption, C)
+    assert da_Sv.name == "Sv" and da_TS.name == "TS"
+    assert da_Sv.dims == dims
+    assert da_Sv.dtype == np.float64 and da_TS.dtype == np.float64
+    assert np.allclose(da_Sv.values, Sv.transpose(*dims).values, equal_nan=True)
+    assert np.allclose(da_TS.values, TS.transpose(*dims).values, equal_nan=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(["cal_type", "spreading_factor"], [("Sv", 20), ("TS", 40)])
+def test_cal_complex_fused(fused_cal_inputs, cal_type, spreading_factor):
+    """
+    Tests the fused complex sample calibration against the term-by-term equations.
+    """
+    dims = fused_cal_inputs["dims"]
+    prx = fused_cal_inputs["complex"]
+    tvg_mod_range = fused_cal_inputs["tvg_mod_range"]
+    absorption = fused_cal_inputs["absorption"]
+    C = fused_cal_inputs["C"]
+
+    # Term-by-term calibration equations
+    r = tvg_mod_range.where(tvg_mod_range > 0, np.nan)
+    p = prx.where(prx > 0, np.nan)
+    expected = 10 * np.log10(p) + spreading_factor * np.log10(r) + 2 * absorption * r - C
+
+    da_cal = _cal_fused("complex", cal_type, prx, tvg_mod_range, absorption, C)
+    assert da_cal.name == cal_type
+    assert da_cal.dims == dims
+    assert da_cal.dtype == np.float64
+    assert np.allclose(da_cal.values, expected.transpose(*dims).values, equal_nan=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("encode_mode", ["power", "complex"])
+def test_cal_fused_channel_order(fused_cal_inputs, encode_mode):
+    """
+    Tests that the fused calibration aligns inputs by channel label,
+    e.g. a user-supplied absorption with channels in a different order.
+    """
+    samples = fused_cal_inputs[encode_mode]
+    tvg_mod_range = fused_cal_inputs["tvg_mod_range"]
+    absorption = fused_cal_inputs["absorption"]
+    C = fused_cal_inputs["C"]
+
+    da_cal = _cal_fused(
+        encode_mode, "Sv", samples, tvg_mod_range, absorption.sel(channel=["chB", "chA"]), C
+    )
+    da_ordered = _cal_fused(encode_mode, "Sv", samples, tvg_mod_range, absorption, C)
+    assert da_cal["channel"].values.tolist() == ["chA", "chB"]
+    assert np.allclose(da_cal.values, da_ordered.values, equal_nan=True)
@@ -382,6 +382,35 @@ def test_get_env_params_EK60_from_data(ek60_path):
     assert env_dict["sound_absorption"].identical(ref_absorption)
 
 
+def test_get_env_params_EK60_from_data_loaded():
+    """
+    Params taken from a lazily opened Environment group are loaded into memory
+    """
+    channel = ["chA", "chB"]
+    time1 = np.array(["2017-06-20T01:00:00"], dtype="datetime64[ns]")
+    ping_time = np.arange(
+        "2017-06-20T01:00:00", "2017-06-20T01:00:05", np.timedelta64(1, "s"), dtype="datetime64[ns]"
+    )
+    env = xr.Dataset(
+        {
+            "sound_speed_indicative": (["time1"], [1500.0]),
+            "absorption_indicative": (["channel", "time1"], [[0.01], [0.03]]),
+        },
+        coords={"channel": channel, "time1": time1},
+    ).chunk()
+    beam = xr.Dataset(
+        {"frequency_nominal": (["channel"], [38000.0, 120000.0])},
+        coords={"channel": channel, "ping_time": ping_time},
+    )
+
+    env_dict = get_env_params_EK(sonar_type="EK60", beam=beam, env=env, user_dict={})
+
+    for p in ["sound_speed", "sound_absorption"]:
+        assert not isinstance(env_dict[p].data, dask.array.Array)
+    assert np.all(env_dict["sound_speed"] == 1500)
+    assert np.all(env_dict["sound_absorption"].sel(channel="chB") == 0.03)
+
+
 @pytest.mark.parametrize(
     ("env_ext", "ref_formula_sound_speed", "ref_formula_absorption"),
     [
@@ -1,11 +1,16 @@
 import pytest
 
+import dask.array
 import numpy as np
 import pandas as pd
+import xarray as xr
 from flox.xarray import xarray_reduce
 import echopype as ep
 from echopype.consolidate import add_location, add_depth
+from echopype.utils.coding import PROCESSED_ZARR_COMPRESSOR
 from echopype.commongrid.utils import (
+    _block_reduce_3d,
+    _rolling_mean_3d,
     _parse_x_bin,
     _groupby_x_along_channels,
     get_distance_from_latlon,
@@ -44,6 +49,47 @@ def test__parse_x_bin(x_bin, x_label, expected_result):
         assert ep.commongrid.api._parse_x_bin(x_bin, x_label) == expected_result
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ["func", "coarsen_func"], [(np.nanmean, "mean"), (np.nanmin, "min")]
+)
+@pytest.mark.parametrize("chunks", [None, (1, 4, 7)])
+@pytest.mark.filterwarnings("error::RuntimeWarning")  # all-NaN blocks should not warn
+def test__block_reduce_3d(func, coarsen_func, chunks):
+    rng = np.random.default_rng(0)
+    arr = rng.random((2, 11, 23))
+    arr[0, :3, :5] = np.nan  # an all-NaN block
+    da = xr.DataArray(arr, dims=("channel", "ping_time", "range_sample"))
+    expected = getattr(
+        da.coarsen(ping_time=3, range_sample=5, boundary="pad"), coarsen_func
+    )(skipna=True)
+
+    if chunks is not None:
+        arr = dask.array.from_array(arr, chunks=chunks)
+    reduced = _block_reduce_3d(arr, 3, 5, func=func)
+    assert isinstance(reduced, type(arr))
+    assert np.allclose(np.asarray(reduced), expected.data, equal_nan=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(["ping_num", "range_sample_num"], [(1, 1), (3, 5), (4, 30)])
+@pytest.mark.parametrize("chunks", [None, (1, 4, 7)])
+def test__rolling_mean_3d(ping_num, range_sample_num, chunks):
+    rng = np.random.default_rng(0)
+    arr = rng.random((2, 11, 23))
+    arr[arr < 0.2] = np.nan
+    arr[0, :4, :] = np.nan  # all-NaN windows
+    da = xr.DataArray(arr, dims=("channel", "ping_time", "range_sample"))
+    expected = da.rolling(ping_time=ping_num, range_sample=range_sample_num, min_periods=1).mean()
+
+    if chunks is not None:
+        arr = dask.array.from_array(arr, chunks=chunks)
+    rolled = _rolling_mean_3d(arr, ping_num, range_sample_num)
+    assert isinstance(rolled, type(arr))
+    assert rolled.shape == arr.shape
+    assert np.allclose(np.asarray(rolled), expected.data, equal_nan=True)
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     ["range_var", "lat_lon"], [("depth", False), ("echo_range", False)]
@@ -197,7 +243,79 @@ def test_compute_MVBS_index_binning(ds_Sv_echo_range_regular, regular_data_param
     )
 
     # Test all values in MVBS
-    assert np.array_equal(ds_MVBS.Sv.data, expected.data)
+    assert np.allclose(ds_MVBS.Sv.data, expected.data, rtol=1e-12, atol=1e-12, equal_nan=True)
+
+    # ping_time is the start of each bin
+    assert np.array_equal(
+        ds_MVBS["ping_time"].values, ds_Sv_echo_range_regular["ping_time"][::ping_num].values
+    )
+
+    # echo_range is the start of each range_sample bin and fully populated
+    expected_echo_range = (
+        ds_Sv_echo_range_regular["echo_range"]
+        .coarsen(ping_time=ping_num, range_sample=range_sample_num, boundary="pad")
+        .min(skipna=True)
+    )
+    assert not ds_MVBS["echo_range"].isnull().any()
+    assert np.allclose(ds_MVBS["echo_range"].data, expected_echo_range.data, rtol=0, atol=1e-12)
+
+
+@pytest.mark.integration
+def test_compute_MVBS_rolling(ds_Sv_echo_range_regular):
+    """Test compute_MVBS_rolling on mock data"""
+
+    ping_num = 3  # number of pings to average over
+    range_sample_num = 7  # number of range_samples to average over
+
+    ds_MVBS = ep.commongrid.compute_MVBS_rolling(
+        ds_Sv_echo_range_regular, range_sample_num=range_sample_num, ping_num=ping_num
+    )
+
+    # Processed data compressor is set for zarr output
+    assert ds_MVBS["Sv"].encoding["compressor"] == PROCESSED_ZARR_COMPRESSOR
+
+    # Same grid as the input
+    assert ds_MVBS.Sv.shape == ds_Sv_echo_range_regular.Sv.shape
+    assert ds_MVBS["ping_time"].equals(ds_Sv_echo_range_regular["ping_time"])
+    assert ds_MVBS["echo_range"].equals(ds_Sv_echo_range_regular["echo_range"])
+
+    # Expected values compute
+    # average should be done in linear domain
+    da_sv = 10 ** (ds_Sv_echo_range_regular["Sv"] / 10)
+    expected = 10 * np.log10(
+        da_sv.rolling(ping_time=ping_num, range_sample=range_sample_num, min_periods=1).mean()
+    )
+    assert np.allclose(ds_MVBS.Sv.data, expected.data, rtol=1e-12, atol=1e-12, equal_nan=True)
+
+
+@pytest.mark.integration
+def test_compute_MVBS_index_binning_log_space_avg(ds_Sv_echo_range_regular):
+    """Test compute_MVBS_index_binning averaging in the log domain on mock data"""
+
+    ping_num = 3  # number of pings to average over
+    range_sample_num = 7  # number of range_samples to average over
+
+    ds_MVBS = ep.commongrid.compute_MVBS_index_binning(
+        ds_Sv_echo_range_regular,
+        range_sample_num=range_sample_num,
+        ping_num=ping_num,
+        log_space_avg=True,
+    )
+    ds_MVBS_lin = ep.commongrid.compute_MVBS_index_binning(
+        ds_Sv_echo_range_regular, range_sample_num=range_sample_num, ping_num=ping_num
+    )
+
+    # Expected values compute: plain mean of Sv in dB
+    expected = (
+        ds_Sv_echo_range_regular["Sv"]
+        .coarsen(ping_time=ping_num, range_sample=range_sample_num, boundary="pad")
+        .mean(skipna=True)
+    )
+    assert np.allclose(ds_MVBS.Sv.data, expected.data, rtol=1e-12, atol=1e-12, equal_nan=True)
+
+    # The dB mean never exceeds the linear-domain mean
+    assert (ds_MVBS.Sv <= ds_MVBS_lin.Sv + 1e-12).where(ds_MVBS.Sv.notnull(), True).all()
+    assert ds_MVBS.Sv.attrs["comment"].endswith("averaged in the log domain")
 
 
 @pytest.mark.unit
@@ -218,6 +336,20 @@ def test_compute_MVBS_bin_inputs_fail(ds_Sv_echo_range_regular, range_bin, ping_
         )
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_compute_MVBS_dtype(ds_Sv_echo_range_regular, dtype):
+    """Test that MVBS keeps the floating point precision of the input Sv"""
+    ds_Sv = ds_Sv_echo_range_regular.copy()
+    ds_Sv["Sv"] = ds_Sv["Sv"].astype(dtype)
+
+    ds_MVBS = ep.commongrid.compute_MVBS(ds_Sv, range_bin="5m", ping_time_bin="10S")
+    assert ds_MVBS["Sv"].dtype == dtype
+
+    ds_MVBS = ep.commongrid.compute_MVBS_index_binning(ds_Sv, range_sample_num=7, ping_num=3)
+    assert ds_MVBS["Sv"].dtype == dtype
+
+
 @pytest.mark.unit
 def test_compute_MVBS_w_latlon(ds_Sv_echo_range_regular_w_latlon, lat_attrs, lon_attrs):
     """Testing for compute_MVBS with latitude and longitude"""
@@ -4,7 +4,14 @@ import xarray as xr
 import math
 import dask
 
-from echopype.utils.coding import _get_auto_chunk, set_netcdf_encodings
+import zarr
+
+from echopype.utils.coding import (
+    PROCESSED_ZARR_COMPRESSOR,
+    _get_auto_chunk,
+    set_netcdf_encodings,
+    set_processed_zarr_compressor,
+)
 
 @pytest.mark.parametrize(
     "chunk",
@@ -69,3 +76,25 @@ def test_set_netcdf_encodings():
     assert encoding["var2"]["zlib"] is True
     assert encoding["var2"]["complevel"] == 5
     assert encoding["var3"]["zlib"] is False
+
+
+def test_set_processed_zarr_compressor(tmp_path):
+    ds = xr.Dataset(
+        {
+            "Sv": xr.DataArray(np.random.rand(2, 10).astype(np.float32), dims=["channel", "ping_time"]),
+            "echo_range": xr.DataArray(np.random.rand(2, 10), dims=["channel", "ping_time"]),
+        }
+    )
+    custom_compressor = zarr.Blosc(cname="zstd", clevel=1)
+    ds["echo_range"].encoding["compressor"] = custom_compressor
+    ds = set_processed_zarr_compressor(ds, ("Sv", "echo_range", "not_a_var"))
+
+    # existing compressor encodings are kept
+    assert ds["Sv"].encoding["compressor"] == PROCESSED_ZARR_COMPRESSOR
+    assert ds["echo_range"].encoding["compressor"] == custom_compressor
+
+    # used when writing to zarr and ignored when writing to netcdf
+    ds.to_zarr(tmp_path / "test.zarr")
+    assert zarr.open(str(tmp_path / "test.zarr"))["Sv"].compressor == PROCESSED_ZARR_COMPRESSOR
+    ds.to_netcdf(tmp_path / "test.nc")
+    assert xr.open_dataset(tmp_path / "test.nc")["Sv"].equals(ds["Sv"])
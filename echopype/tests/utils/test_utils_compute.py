@@ -0,0 +1,62 @@
+import pytest
+
+import dask.array
+import numpy as np
+import xarray as xr
+
+from echopype.utils.compute import _lin2log, _log2lin, _log2lin_expm1
+
+
+@pytest.fixture
+def Sv_values():
+    rng = np.random.default_rng(0)
+    return rng.uniform(-120, 0, size=(2, 10, 20))
+
+
+def test_log2lin_lin2log_numpy(Sv_values):
+    sv = _log2lin(Sv_values)
+    assert isinstance(sv, np.ndarray)
+    assert np.allclose(sv, 10 ** (Sv_values / 10))
+    assert np.allclose(_lin2log(sv), Sv_values)
+
+
+def test_log2lin_lin2log_nan_and_zero():
+    assert np.isnan(_log2lin(np.array([np.nan]))).all()
+    assert np.isneginf(_lin2log(np.array([0.0]))).all()
+
+
+@pytest.mark.parametrize("chunks", [None, {"ping_time": 3}])
+def test_log2lin_lin2log_xarray(Sv_values, chunks):
+    da_Sv = xr.DataArray(Sv_values, dims=("channel", "ping_time", "range_sample"), name="Sv")
+    if chunks is not None:
+        da_Sv = da_Sv.chunk(chunks)
+
+    da_sv = _log2lin(da_Sv)
+    assert isinstance(da_sv, xr.DataArray)
+    assert da_sv.dims == da_Sv.dims
+    assert isinstance(da_sv.data, dask.array.Array) == (chunks is not None)
+    assert np.allclose(da_sv.values, 10 ** (Sv_values / 10))
+    assert np.allclose(_lin2log(da_sv).values, Sv_values)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_log2lin_lin2log_dtype(Sv_values, dtype):
+    Sv = Sv_values.astype(dtype)
+    assert _log2lin(Sv).dtype == dtype
+    assert _lin2log(_log2lin(Sv)).dtype == dtype
+    assert _log2lin(np.array([-10, 0, 10])).dtype == np.float64
+
+
+def test_log2lin_expm1():
+    # difference in linear domain of Sv values just above a noise level
+    Sv_noise = np.full(5, -120.0)
+    Sv = Sv_noise + np.array([1e-9, 1e-6, 1e-3, 3, 30])
+    diff = _lin2log(_log2lin_expm1(Sv - Sv_noise)) + Sv_noise
+
+    # reference in extended precision where available
+    Sv_diff = Sv.astype(np.longdouble) - Sv_noise.astype(np.longdouble)
+    expected = Sv_noise + 10 * np.log10(np.expm1(Sv_diff * np.log(np.longdouble(10)) / 10))
+    assert np.allclose(diff, expected.astype(np.float64), rtol=0, atol=1e-12)
+
+    assert _log2lin_expm1(np.array([0.0]))[0] == 0
+    assert np.allclose(_log2lin_expm1(np.array([10.0, -10.0])), [9, -0.9])
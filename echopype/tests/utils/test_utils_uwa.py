@@ -1,6 +1,7 @@
 import pytest
 
 import numpy as np
+import xarray as xr
 
 from echopype.utils.uwa import calc_absorption, calc_sound_speed
 
@@ -63,3 +64,36 @@ def test_sound_speed(temperature, salinity, pressure, tolerance):
             formula_source=fm
         )
     assert np.abs(c["Mackenzie"] - c["AZFP"]) < tolerance
+
+
+@pytest.mark.parametrize("formula_source", ["AM", "FG", "AZFP"])
+def test_absorption_cached(formula_source):
+    frequency = xr.DataArray(
+        [18e3, 38e3, 120e3], dims=["channel"], coords={"channel": ["ch1", "ch2", "ch3"]}
+    )
+    kwargs = dict(temperature=10, salinity=35, pressure=10, formula_source=formula_source)
+
+    # scalar env params are memoized, array env params are computed directly
+    abs_cached = calc_absorption(frequency=frequency, **kwargs)
+    abs_direct = calc_absorption(
+        frequency=frequency, **dict(kwargs, temperature=xr.DataArray(10))
+    )
+    assert isinstance(abs_cached, xr.DataArray)
+    assert abs_cached.dims == ("channel",)
+    assert np.allclose(abs_cached, abs_direct)
+
+    # cache hit returns an independent copy of the same values
+    abs_ndarray = calc_absorption(frequency=frequency.values, **kwargs)
+    abs_ndarray[:] = 0
+    assert np.allclose(calc_absorption(frequency=frequency.values, **kwargs), abs_direct)
+
+    abs_dataarray = calc_absorption(frequency=frequency, **kwargs)
+    abs_dataarray.values[:] = 0
+    assert np.allclose(calc_absorption(frequency=frequency, **kwargs), abs_direct)
+
+
+def test_sound_speed_cached():
+    c_cached = calc_sound_speed(temperature=10, salinity=35, pressure=10)
+    c_direct = calc_sound_speed(temperature=np.array(10), salinity=35, pressure=10)
+    assert c_cached == calc_sound_speed(temperature=10, salinity=35, pressure=10)
+    assert np.isclose(c_cached, c_direct)
@@ -26,6 +26,10 @@ COMPRESSION_SETTINGS = {
     },
 }
 
+# Processed float data (e.g. Sv, TS, MVBS) are rewritten and re-read far more often than raw data:
+# lz4 with bit-shuffling compresses them about as well as zstd but several times faster
+PROCESSED_ZARR_COMPRESSOR = zarr.Blosc(cname="lz4", clevel=5, shuffle=zarr.Blosc.BITSHUFFLE)
+
 
 DEFAULT_ENCODINGS = {
     "ping_time": DEFAULT_TIME_ENCODING,
@@ -138,6 +142,32 @@ def set_time_encodings(ds: xr.Dataset) -> xr.Dataset:
     return new_ds
 
 
+def set_processed_zarr_compressor(ds: xr.Dataset, var_names: Tuple[str, ...]) -> xr.Dataset:
+    """
+    Set ``PROCESSED_ZARR_COMPRESSOR`` as the default zarr compressor of processed variables.
+
+    The compressor is stored in the variable encoding, so it is used by ``Dataset.to_zarr``
+    unless overridden by an explicit ``encoding``, and ignored by ``Dataset.to_netcdf``.
+    Existing compressor encodings are kept.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        The processed dataset
+    var_names : tuple of str
+        Names of the variables to set the compressor for, if they exist in ``ds``
+
+    Returns
+    -------
+    xr.Dataset
+        The same dataset, with encodings updated in place
+    """
+    for name in var_names:
+        if name in ds:
+            ds[name].encoding.setdefault("compressor", PROCESSED_ZARR_COMPRESSOR)
+    return ds
+
+
 def get_zarr_compression(var: xr.Variable, compression_settings: dict) -> dict:
     """Returns the proper zarr compressor for a given variable type"""
 
@@ -7,36 +7,104 @@ for performing computations within echopype.
 from typing import Union
 
 import dask.array
+import numexpr as ne
 import numpy as np
+import xarray as xr
 
+# 10 ** (x / 10) == exp(x * ln(10) / 10) and 10 * log10(x) == log(x) * 10 / ln(10),
+# written out so that numexpr evaluates each transform in a single fused pass
+_LOG2LIN_EXPR = "exp(data * k)"
+_LOG2LIN_FACTOR = 0.23025850929940458
+_LIN2LOG_EXPR = "log(data) * k"
+_LIN2LOG_FACTOR = 4.3429448190325175
+# 10 ** (x / 10) - 1 == expm1(x * ln(10) / 10), without cancellation for x close to 0
+_LOG2LIN_EXPM1_EXPR = "expm1(data * k)"
 
-def _log2lin(data: Union[dask.array.Array, np.ndarray]) -> Union[dask.array.Array, np.ndarray]:
+
+def _evaluate(
+    data: Union[xr.DataArray, dask.array.Array, np.ndarray], expr: str, k: float
+) -> Union[xr.DataArray, dask.array.Array, np.ndarray]:
+    """Evaluate a single-variable numexpr expression on in-memory or lazy data
+
+    Parameters
+    ----------
+    data : xr.DataArray or dask.array.Array or np.ndarray
+        The data to be transformed
+    expr : str
+        The numexpr expression, referring to the input as ``data``
+        and to the constant factor as ``k``
+    k : float
+        The constant factor, cast to the floating point precision of ``data``
+        so that float32 data is not promoted to float64
+
+    Returns
+    -------
+    xr.DataArray or dask.array.Array or np.ndarray
+        The transformed data, of the same type as the input
+    """
+    if isinstance(data, xr.DataArray):
+        return xr.apply_ufunc(_evaluate, data, kwargs={"expr": expr, "k": k}, dask="allowed")
+    if isinstance(data, dask.array.Array):
+        return data.map_blocks(_evaluate, expr=expr, k=k)
+    data = np.asarray(data)
+    dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else np.dtype(np.float64)
+    return ne.evaluate(expr, local_dict={"data": data, "k": dtype.type(k)})
+
+
+def _log2lin(
+    data: Union[xr.DataArray, dask.array.Array, np.ndarray]
+) -> Union[xr.DataArray, dask.array.Array, np.ndarray]:
     """Perform log to linear transform on data
 
     Parameters
     ----------
-    data : dask.array.Array or np.ndarray
+    data : xr.DataArray or dask.array.Array or np.ndarray
          The data to be transformed
 
     Returns
     -------
-    dask.array.Array or np.ndarray
+    xr.DataArray or dask.array.Array or np.ndarray
         The transformed data
     """
-    return 10 ** (data / 10)
+    return _evaluate(data, _LOG2LIN_EXPR, _LOG2LIN_FACTOR)
 
 
-def _lin2log(data: Union[dask.array.Array, np.ndarray]) -> Union[dask.array.Array, np.ndarray]:
+def _lin2log(
+    data: Union[xr.DataArray, dask.array.Array, np.ndarray]
+) -> Union[xr.DataArray, dask.array.Array, np.ndarray]:
     """Perform linear to log transform on data
 
     Parameters
     ----------
-    data : dask.array.Array or np.ndarray
+    data : xr.DataArray or dask.array.Array or np.ndarray
+         The data to be transformed
+
+    Returns
+    -------
+    xr.DataArray or dask.array.Array or np.ndarray
+        The transformed data
+    """
+    return _evaluate(data, _LIN2LOG_EXPR, _LIN2LOG_FACTOR)
+
+
+def _log2lin_expm1(
+    data: Union[xr.DataArray, dask.array.Array, np.ndarray]
+) -> Union[xr.DataArray, dask.array.Array, np.ndarray]:
+    """Perform log to linear transform on data and subtract 1, accurately for data close to 0
+
+    This allows the difference of two values in the linear domain
+    to be computed from their difference in the log domain,
+    since ``10 ** (a / 10) - 10 ** (b / 10) == 10 ** (b / 10) * (10 ** ((a - b) / 10) - 1)``,
+    avoiding the cancellation of subtracting two nearly equal linear values.
+
+    Parameters
+    ----------
+    data : xr.DataArray or dask.array.Array or np.ndarray
          The data to be transformed
 
     Returns
     -------
-    dask.array.Array or np.ndarray
+    xr.DataArray or dask.array.Array or np.ndarray
         The transformed data
     """
-    return 10 * np.log10(data)
+    return _evaluate(data, _LOG2LIN_EXPM1_EXPR, _LOG2LIN_FACTOR)
@@ -2,7 +2,20 @@
 Utilities for calculating seawater acoustic properties.
 """
 
+from functools import lru_cache
+from numbers import Number
+
 import numpy as np
+import xarray as xr
+
+# Maximum number of distinct environmental conditions memoized
+# for sound speed and absorption calculations
+_CACHE_SIZE = 256
+
+
+def _all_numbers(*args) -> bool:
+    """Check if all args are hashable scalar numbers that can serve as a cache key."""
+    return all(isinstance(a, Number) for a in args)
 
 
 def calc_sound_speed(temperature=27, salinity=35, pressure=10, formula_source="Mackenzie"):
@@ -36,6 +49,17 @@ def calc_sound_speed(temperature=27, salinity=35, pressure=10, formula_source="M
     The ranges of validity encompass the following:
     temperature −2 to 30 °C, salinity 30 to 40 ppt, and depth 0 to 8000 m.
     """
+    if _all_numbers(temperature, salinity, pressure):
+        return _calc_sound_speed_cached(temperature, salinity, pressure, formula_source)
+    return _calc_sound_speed(temperature, salinity, pressure, formula_source)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _calc_sound_speed_cached(temperature, salinity, pressure, formula_source):
+    return _calc_sound_speed(temperature, salinity, pressure, formula_source)
+
+
+def _calc_sound_speed(temperature, salinity, pressure, formula_source):
     if formula_source == "Mackenzie":
         ss = 1448.96 + 4.591 * temperature - 5.304e-2 * temperature**2 + 2.374e-4 * temperature**3
         ss += 1.340 * (salinity - 35) + 1.630e-2 * pressure + 1.675e-7 * pressure**2
@@ -105,6 +129,57 @@ def calc_absorption(
     compared with the original complicated formula from Francois & Garrison 1982
     was demonstrated between 100 Hz and 1 MHz.
     """
+    # Memoize on scalar environmental params and the bytes of the frequency array,
+    # since the same conditions are typically used across all files in a batch
+    if _all_numbers(temperature, salinity, pressure, pH) and (
+        sound_speed is None or _all_numbers(sound_speed)
+    ):
+        freq = np.asarray(frequency)
+        sea_abs = _calc_absorption_cached(
+            freq.tobytes(),
+            freq.dtype.str,
+            freq.shape,
+            temperature,
+            salinity,
+            pressure,
+            pH,
+            sound_speed,
+            formula_source,
+        )
+        if isinstance(sea_abs, np.ndarray):
+            sea_abs = sea_abs.copy()  # do not expose the cached array to in-place changes
+        if isinstance(frequency, xr.DataArray):
+            return xr.DataArray(
+                sea_abs, dims=frequency.dims, coords=frequency.coords, name=frequency.name
+            )
+        return sea_abs
+
+    return _calc_absorption(
+        frequency, temperature, salinity, pressure, pH, sound_speed, formula_source
+    )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _calc_absorption_cached(
+    freq_bytes,
+    freq_dtype,
+    freq_shape,
+    temperature,
+    salinity,
+    pressure,
+    pH,
+    sound_speed,
+    formula_source,
+):
+    frequency = np.frombuffer(freq_bytes, dtype=freq_dtype).reshape(freq_shape)
+    if frequency.ndim == 0:
+        frequency = frequency.item()
+    return _calc_absorption(
+        frequency, temperature, salinity, pressure, pH, sound_speed, formula_source
+    )
+
+
+def _calc_absorption(frequency, temperature, salinity, pressure, pH, sound_speed, formula_source):
     if formula_source == "FG":
         f = frequency / 1000.0  # convert from Hz to kHz due to formula
         if sound_speed is None: